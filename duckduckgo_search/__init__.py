@@ -4,21 +4,37 @@ Search for words, documents, images, videos, news, maps and text translation
 using the DuckDuckGo.com search engine.
 """
 
-import asyncio
 import logging
 import sys
+from typing import TYPE_CHECKING, Any
 
-from .duckduckgo_search import DDGS
-from .duckduckgo_search_async import AsyncDDGS
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .duckduckgo_search import DDGS
+    from .duckduckgo_search_async import AsyncDDGS
+
 __all__ = ["DDGS", "AsyncDDGS", "__version__", "cli"]
 
 
 if sys.platform == "win32":
+    import asyncio
+
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
+def __getattr__(name: str) -> Any:
+    """Import DDGS and AsyncDDGS (and primp with them) on first access, so the CLI starts fast."""
+    if name == "DDGS":
+        from .duckduckgo_search import DDGS as value
+    elif name == "AsyncDDGS":
+        from .duckduckgo_search_async import AsyncDDGS as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
 # A do-nothing logging handler
 # https://docs.python.org/3.3/howto/logging.html#configuring-logging-for-a-library
 logging.getLogger("duckduckgo_search").addHandler(logging.NullHandler())
@@ -1,130 +1,309 @@
 import csv
 import logging
 import os
+import re
 import sys
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from contextlib import contextmanager, nullcontext, suppress
+from functools import partial, wraps
+from hashlib import sha1
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from threading import Lock
 from urllib.parse import unquote
 
 import click
-import primp
+from click.globals import pop_context, push_context
 
-from .duckduckgo_search import DDGS
-from .utils import _expand_proxy_tb_alias, json_dumps, json_loads
+from .utils import _expand_proxy_tb_alias, json_dumps_bytes, json_loads
 from .version import __version__
 
 logger = logging.getLogger(__name__)
 
-COLORS = {
-    0: "black",
-    1: "red",
-    2: "green",
-    3: "yellow",
-    4: "blue",
-    5: "magenta",
-    6: "cyan",
-    7: "bright_black",
-    8: "bright_red",
-    9: "bright_green",
-    10: "bright_yellow",
-    11: "bright_blue",
-    12: "bright_magenta",
-    13: "bright_cyan",
-    14: "white",
-    15: "bright_white",
-}
+_DDGS_LOCK = Lock()
+# taken once per run, so every file and directory of a chained invocation gets the same suffix
+_TIMESTAMP = time.strftime("%Y%m%d_%H%M%S")
+
+COLORS = (
+    "black",
+    "red",
+    "green",
+    "yellow",
+    "blue",
+    "magenta",
+    "cyan",
+    "bright_black",
+    "bright_red",
+    "bright_green",
+    "bright_yellow",
+    "bright_blue",
+    "bright_magenta",
+    "bright_cyan",
+    "white",
+    "bright_white",
+)
+
+# precomputed ANSI escapes, equivalent to click.secho(..., bg="black", fg=COLORS[j], overline=True)
+_COLOR_STYLES = tuple(click.style("", bg="black", fg=color, overline=True, reset=False) for color in COLORS)
+_HEADER_STYLE = click.style("", bg="black", fg="white", reset=False)
+_STYLE_RESET = "\x1b[0m"
+
+_DOWNLOADED_FILE = ".ddgs_downloaded"
+_CSV_NEEDS_QUOTE = re.compile(r'[",\r\n]').search
+_SANITIZE_STRIP = re.compile("filetype|:").sub
+_SANITIZE_TABLE = str.maketrans({'"': "'", " ": "_", "/": "_", "\\": "_"})
+
+
+def _parse_output(filename):
+    """Split the -o value into (filename or None, extension)."""
+    if filename and filename.endswith((".csv", ".json", ".msgpack")):
+        return filename.rsplit(".", 1)
+    return None, filename
+
+
+@contextmanager
+def _open_replace(path, mode, **kwargs):
+    """Write to a temporary file next to path, moved onto path only when writing finished without errors."""
+    tmp_path = f"{os.fspath(path)}.part"
+    try:
+        with open(tmp_path, mode, **kwargs) as file:
+            yield file
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
 
 def _save_data(keywords, data, function_name, filename):
-    filename, ext = filename.rsplit(".", 1) if filename and filename.endswith((".csv", ".json")) else (None, filename)
-    filename = filename if filename else f"{function_name}_{keywords}_{datetime.now():%Y%m%d_%H%M%S}"
+    filename, ext = _parse_output(filename)
+    filename = filename if filename else f"{function_name}_{keywords}_{_TIMESTAMP}"
     if ext == "csv":
         _save_csv(f"{filename}.{ext}", data)
     elif ext == "json":
         _save_json(f"{filename}.{ext}", data)
+    elif ext == "msgpack":
+        _save_msgpack(f"{filename}.{ext}", data)
 
 
 def _save_json(jsonfile, data):
-    with open(jsonfile, "w", encoding="utf-8") as file:
-        file.write(json_dumps(data))
+    with _open_replace(jsonfile, "wb") as file:
+        if isinstance(data, (list, dict)):
+            file.write(json_dumps_bytes(data))
+            return
+        # stream an iterator of results as an indented json array without materializing it
+        sep = b"[\n  "
+        for res in data:
+            file.write(sep)
+            file.write(json_dumps_bytes(res).replace(b"\n", b"\n  "))
+            sep = b",\n  "
+        file.write(b"[]" if sep == b"[\n  " else b"\n]")
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as ex:
+        raise ImportError("msgpack is not installed: pip install -U duckduckgo_search[msgpack]") from ex
+    return msgpack
+
+
+def _save_msgpack(msgpackfile, data):
+    msgpack = _import_msgpack()
+    data = data if isinstance(data, list) else list(data)
+    with _open_replace(msgpackfile, "wb", buffering=1 << 20) as file:
+        file.write(msgpack.packb(data, use_bin_type=True))
 
 
 def _save_csv(csvfile, data):
-    with open(csvfile, "w", newline="", encoding="utf-8") as file:
-        if data:
-            headers = data[0].keys()
+    with _open_replace(csvfile, "w", newline="", encoding="utf-8", buffering=1 << 20) as file:
+        data = iter(data)
+        first = next(data, None)
+        if first:
+            headers = list(first.keys())
+            data = chain((first,), data)
             writer = csv.DictWriter(file, fieldnames=headers, quoting=csv.QUOTE_MINIMAL)
             writer.writeheader()
-            writer.writerows(data)
-
-
-def _print_data(data):
-    if data:
-        for i, e in enumerate(data, start=1):
-            click.secho(f"{i}.\t    {'=' * 78}", bg="black", fg="white")
-            for j, (k, v) in enumerate(e.items(), start=1):
-                if v:
-                    width = 300 if k in ("content", "href", "image", "source", "thumbnail", "url") else 78
-                    k = "language" if k == "detected_language" else k
-                    text = click.wrap_text(
-                        f"{v}", width=width, initial_indent="", subsequent_indent=" " * 12, preserve_paragraphs=True
-                    )
+            if len(headers) < 2:
+                writer.writerows(data)
+                return
+            # fast path: join plain rows directly, let csv handle rows that need quoting
+            getter = itemgetter(*headers)
+            for row in data:
+                if len(row) != len(headers):
+                    writer.writerow(row)
+                    continue
+                values = ["" if v is None else str(v) for v in getter(row)]
+                if any(map(_CSV_NEEDS_QUOTE, values)):
+                    writer.writerow(row)
                 else:
-                    text = v
-                click.secho(f"{k:<12}{text}", bg="black", fg=COLORS[j], overline=True)
-            input()
+                    file.write(",".join(values) + "\r\n")
+
+
+def _format_data(data, styled):
+    """Yield one formatted block of lines per result, wrapped in ANSI styles if styled."""
+    header_style, reset = (_HEADER_STYLE, _STYLE_RESET) if styled else ("", "")
+    for i, e in enumerate(data, start=1):
+        lines = [f"{header_style}{i}.\t    {'=' * 78}{reset}\n"]
+        for j, (k, v) in enumerate(e.items(), start=1):
+            if v:
+                width = 300 if k in ("content", "href", "image", "source", "thumbnail", "url") else 78
+                k = "language" if k == "detected_language" else k
+                text = click.wrap_text(
+                    f"{v}", width=width, initial_indent="", subsequent_indent=" " * 12, preserve_paragraphs=True
+                )
+            else:
+                text = v
+            # cycle over 1..15, index 0 is black on the black background
+            style = _COLOR_STYLES[1 + (j - 1) % (len(_COLOR_STYLES) - 1)] if styled else ""
+            lines.append(f"{style}{k:<12}{text}{reset}\n")
+        yield "".join(lines)
+
+
+def _print_data(data, paginate=False):
+    if data:
+        if sys.stdout.isatty():
+            if paginate:
+                for block in _format_data(data, styled=True):
+                    click.echo(block, nl=False)
+                    input()
+            else:
+                click.echo_via_pager(_format_data(data, styled=True))
+        else:
+            # not a terminal: no pause between results, write everything at once
+            sys.stdout.write("".join(_format_data(data, styled=False)))
 
 
 def _sanitize_keywords(keywords):
-    keywords = (
-        keywords.replace("filetype", "")
-        .replace(":", "")
-        .replace('"', "'")
-        .replace("site", "")
-        .replace(" ", "_")
-        .replace("/", "_")
-        .replace("\\", "_")
-        .replace(" ", "")
-    )
-    return keywords
+    # "site" is stripped after ":" so that e.g. "si:te" is removed as well
+    return _SANITIZE_STRIP("", keywords).replace("site", "").translate(_SANITIZE_TABLE)
 
 
-def _download_file(url, dir_path, filename, proxy, verify):
+def _download_file(url, path_prefix, index, client):
+    # the filename is built here, in the worker thread, to keep the dispatch loop short
+    filepath = f"{path_prefix}{index}_{unquote(url.split('/')[-1].split('?')[0])}"[: len(path_prefix) + 200]
+    if os.path.exists(filepath):
+        return False
     try:
-        resp = primp.Client(proxy=proxy, impersonate="chrome_131", timeout=10, verify=verify).get(url)
+        resp = client.get(url)
         if resp.status_code == 200:
-            with open(os.path.join(dir_path, filename[:200]), "wb") as file:
-                file.write(resp.content)
+            # primp has no streaming api, so release the response and keep only one copy of the body
+            content = resp.content
+            del resp
+            with open(filepath, "wb") as file:
+                file.write(content)
+            return True
     except Exception as ex:
         logger.debug(f"download_file url={url} {type(ex).__name__} {ex}")
+    return False
 
 
 def _download_results(keywords, results, function_name, proxy=None, threads=None, verify=True, pathname=None):
-    path = pathname if pathname else f"{function_name}_{keywords}_{datetime.now():%Y%m%d_%H%M%S}"
-    os.makedirs(path, exist_ok=True)
+    import primp
+
+    path = pathname if pathname else f"{function_name}_{keywords}_{_TIMESTAMP}"
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    path_prefix = os.path.join(path, "")  # path + separator, joined once instead of per file
+
+    # downloads are latency-bound, so scale well past the cpu count (reqwest's pool has no connection cap)
+    threads = min(64, (os.cpu_count() or 4) * 8) if threads is None else threads
+    # one client shared by all workers, so connections are pooled and reused between downloads
+    client = primp.Client(proxy=proxy, impersonate="chrome_131", timeout=10, verify=verify)
+    # sha1 of the urls already downloaded into this directory by previous runs,
+    # only kept for a directory given by the user, a default directory is new on every run
+    downloaded_file = path_prefix + _DOWNLOADED_FILE if pathname else None
+    downloaded = set()
+    if downloaded_file and os.path.exists(downloaded_file):
+        with open(downloaded_file) as file:
+            downloaded = set(file.read().split())
 
-    threads = 10 if threads is None else threads
     with ThreadPoolExecutor(max_workers=threads) as executor:
-        futures = []
+        futures = {}
         for i, res in enumerate(results, start=1):
             url = res["image"] if function_name == "images" else res["href"]
-            filename = unquote(url.split("/")[-1].split("?")[0])
-            f = executor.submit(_download_file, url, path, f"{i}_{filename}", proxy, verify)
-            futures.append(f)
-
-        with click.progressbar(
+            url_hash = sha1(url.encode()).hexdigest()
+            if url_hash in downloaded:
+                continue
+            downloaded.add(url_hash)
+            f = executor.submit(_download_file, url, path_prefix, i, client)
+            futures[f] = url_hash
+
+        # each hash is recorded as soon as its download completes, so an interrupted run keeps its progress
+        record = downloaded_file and futures
+        with open(downloaded_file, "a") if record else nullcontext() as file, click.progressbar(
             length=len(futures), label="Downloading", show_percent=True, show_pos=True, width=50
         ) as bar:
             for future in as_completed(futures):
-                future.result()
+                if future.result() and record:
+                    file.write(f"{futures[future]}\n")
+                    file.flush()
                 bar.update(1)
 
 
+def _get_ddgs(ctx, proxy, verify):
+    """Return a new DDGS for one command, sharing the HTTP client cached in the click context.
+
+    Chained commands reuse the connections, but each keeps its own error state, so a failed search
+    does not make the other searches of the chain fail.
+    """
+    from .duckduckgo_search import DDGS
+
+    ddgs = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify)
+    key = ("client", proxy, verify)
+    with _DDGS_LOCK:
+        ddgs.client = ctx.obj.setdefault(key, ddgs.client)
+    return ddgs
+
+
+def _chained(f):
+    """Defer a command so that the searches of a chain run concurrently.
+
+    f is a generator function: the code before its bare `yield` performs the search and runs in a worker
+    thread, the code after it saves or prints the results and runs on the main thread in command order.
+    Commands with nothing to fetch up front (version, chat) yield first, so they keep their place in the chain.
+    """
+
+    @wraps(f)
+    def wrapper(**kwargs):
+        # fail before any search of the chain runs if the output format needs a missing optional dependency
+        if _parse_output(kwargs.get("output"))[1] == "msgpack":
+            _import_msgpack()
+        click.get_current_context().obj.setdefault("pending", []).append(partial(f, **kwargs))
+
+    return wrapper
+
+
+def _search_in_context(ctx, gen):
+    push_context(ctx)
+    try:
+        next(gen)
+    finally:
+        pop_context()
+
+
 @click.group(chain=True)
-def cli():
+@click.option("--paginate", is_flag=True, default=False, help="pause after each result instead of using a pager")
+@click.pass_context
+def cli(ctx, paginate):
     """duckduckgo_search CLI tool"""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["paginate"] = paginate
+
+
+@cli.result_callback()
+def _run_pending(results, paginate):
+    ctx = click.get_current_context()
+    gens = [task() for task in ctx.obj.pop("pending", [])]
+    if not gens:
+        return
+    with ThreadPoolExecutor(max_workers=len(gens)) as executor:
+        futures = [executor.submit(_search_in_context, ctx, gen) for gen in gens]
+        for gen, future in zip(gens, futures):
+            future.result()
+            next(gen, None)
 
 
 def safe_entry_point():
@@ -135,12 +314,14 @@ def safe_entry_point():
 
 
 @cli.command()
+@_chained
 def version():
+    yield
     print(__version__)
-    return __version__
 
 
 @cli.command()
+@_chained
 @click.option("-l", "--load", is_flag=True, default=False, help="load the last conversation from the json cache")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-ml", "--multiline", is_flag=True, default=False, help="multi-line input")
@@ -161,7 +342,8 @@ def version():
 )
 def chat(load, proxy, multiline, timeout, verify, model):
     """CLI function to perform an interactive AI chat using DuckDuckGo API."""
-    client = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify)
+    yield
+    client = _get_ddgs(click.get_current_context(), proxy, verify)
     model = ["gpt-4o-mini", "claude-3-haiku", "llama-3.1-70b", "mixtral-8x7b"][int(model) - 1]
 
     cache_file = "ddgs_chat_conversation.json"
@@ -189,16 +371,17 @@ def chat(load, proxy, multiline, timeout, verify, model):
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="text search, keywords for query")
 @click.option("-r", "--region", default="wt-wt", help="wt-wt, us-en, ru-ru, etc. -region https://duckduckgo.com/params")
 @click.option("-s", "--safesearch", default="moderate", type=click.Choice(["on", "moderate", "off"]))
 @click.option("-t", "--timelimit", type=click.Choice(["d", "w", "m", "y"]), help="day, week, month, year")
 @click.option("-m", "--max_results", type=int, help="maximum number of results")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-d", "--download", is_flag=True, default=False, help="download results. -dd to set custom directory")
 @click.option("-dd", "--download-directory", help="Specify custom download directory")
 @click.option("-b", "--backend", default="api", type=click.Choice(["api", "html", "lite"]), help="which backend to use")
-@click.option("-th", "--threads", default=10, help="download threads, default=10")
+@click.option("-th", "--threads", type=int, help="download threads, default=min(64, cpu_count*8)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def text(
@@ -216,7 +399,11 @@ def text(
     verify,
 ):
     """CLI function to perform a text search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).text(
+    ddgs = _get_ddgs(click.get_current_context(), proxy, verify)
+    # results that are only saved to a csv or json file are streamed to it as they arrive
+    streamed = output and not download and _parse_output(output)[1] in ("csv", "json")
+    search = ddgs._text_iter if streamed else ddgs.text
+    data = search(
         keywords=keywords,
         region=region,
         safesearch=safesearch,
@@ -224,6 +411,7 @@ def text(
         backend=backend,
         max_results=max_results,
     )
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, "text", filename=output)
@@ -238,25 +426,28 @@ def text(
             pathname=download_directory,
         )
     if not output and not download:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="answers search, keywords for query")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def answers(keywords, output, proxy, verify):
     """CLI function to perform a answers search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).answers(keywords=keywords)
+    data = _get_ddgs(click.get_current_context(), proxy, verify).answers(keywords=keywords)
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="answers", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="keywords for query")
 @click.option("-r", "--region", default="wt-wt", help="wt-wt, us-en, ru-ru, etc. -region https://duckduckgo.com/params")
 @click.option("-s", "--safesearch", default="moderate", type=click.Choice(["on", "moderate", "off"]))
@@ -292,10 +483,10 @@ def answers(keywords, output, proxy, verify):
     type=click.Choice(["any", "Public", "Share", "ShareCommercially", "Modify", "ModifyCommercially"]),
 )
 @click.option("-m", "--max_results", type=int, help="maximum number of results")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-d", "--download", is_flag=True, default=False, help="download results. -dd to set custom directory")
 @click.option("-dd", "--download-directory", help="Specify custom download directory")
-@click.option("-th", "--threads", default=10, help="download threads, default=10")
+@click.option("-th", "--threads", type=int, help="download threads, default=min(64, cpu_count*8)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def images(
@@ -317,7 +508,7 @@ def images(
     verify,
 ):
     """CLI function to perform a images search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).images(
+    data = _get_ddgs(click.get_current_context(), proxy, verify).images(
         keywords=keywords,
         region=region,
         safesearch=safesearch,
@@ -329,6 +520,7 @@ def images(
         license_image=license_image,
         max_results=max_results,
     )
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="images", filename=output)
@@ -343,10 +535,11 @@ def images(
             pathname=download_directory,
         )
     if not output and not download:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="keywords for query")
 @click.option("-r", "--region", default="wt-wt", help="wt-wt, us-en, ru-ru, etc. -region https://duckduckgo.com/params")
 @click.option("-s", "--safesearch", default="moderate", type=click.Choice(["on", "moderate", "off"]))
@@ -355,14 +548,14 @@ def images(
 @click.option("-d", "--duration", type=click.Choice(["short", "medium", "long"]))
 @click.option("-lic", "--license_videos", type=click.Choice(["creativeCommon", "youtube"]))
 @click.option("-m", "--max_results", type=int, help="maximum number of results")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def videos(
     keywords, region, safesearch, timelimit, resolution, duration, license_videos, max_results, output, proxy, verify
 ):
     """CLI function to perform a videos search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).videos(
+    data = _get_ddgs(click.get_current_context(), proxy, verify).videos(
         keywords=keywords,
         region=region,
         safesearch=safesearch,
@@ -372,35 +565,39 @@ def videos(
         license_videos=license_videos,
         max_results=max_results,
     )
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="videos", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="keywords for query")
 @click.option("-r", "--region", default="wt-wt", help="wt-wt, us-en, ru-ru, etc. -region https://duckduckgo.com/params")
 @click.option("-s", "--safesearch", default="moderate", type=click.Choice(["on", "moderate", "off"]))
 @click.option("-t", "--timelimit", type=click.Choice(["d", "w", "m", "y"]), help="day, week, month, year")
 @click.option("-m", "--max_results", type=int, help="maximum number of results")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def news(keywords, region, safesearch, timelimit, max_results, output, proxy, verify):
     """CLI function to perform a news search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).news(
+    data = _get_ddgs(click.get_current_context(), proxy, verify).news(
         keywords=keywords, region=region, safesearch=safesearch, timelimit=timelimit, max_results=max_results
     )
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="news", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="keywords for query")
 @click.option("-p", "--place", help="simplified search - if set, the other parameters are not used")
 @click.option("-s", "--street", help="house number/street")
@@ -413,7 +610,7 @@ def news(keywords, region, safesearch, timelimit, max_results, output, proxy, ve
 @click.option("-lon", "--longitude", help="""if lat and long are set, the other params are not used""")
 @click.option("-r", "--radius", default=0, help="expand the search square by the distance in kilometers")
 @click.option("-m", "--max_results", type=int, help="maximum number of results")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-proxy", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def maps(
@@ -434,7 +631,7 @@ def maps(
     verify,
 ):
     """CLI function to perform a maps search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).maps(
+    data = _get_ddgs(click.get_current_context(), proxy, verify).maps(
         keywords=keywords,
         place=place,
         street=street,
@@ -448,44 +645,49 @@ def maps(
         radius=radius,
         max_results=max_results,
     )
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="maps", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="text for translation")
 @click.option("-f", "--from_", help="What language to translate from (defaults automatically)")
 @click.option("-t", "--to", default="en", help="de, ru, fr, etc. What language to translate, defaults='en'")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def translate(keywords, from_, to, output, proxy, verify):
     """CLI function to perform translate using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).translate(keywords=keywords, from_=from_, to=to)
+    data = _get_ddgs(click.get_current_context(), proxy, verify).translate(keywords=keywords, from_=from_, to=to)
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="translate", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 @cli.command()
+@_chained
 @click.option("-k", "--keywords", required=True, help="keywords for query")
 @click.option("-r", "--region", default="wt-wt", help="wt-wt, us-en, ru-ru, etc. -region https://duckduckgo.com/params")
-@click.option("-o", "--output", help="csv, json or filename.csv|json (save the results to a csv or json file)")
+@click.option("-o", "--output", help="csv, json, msgpack or filename.csv|json|msgpack (save the results to a file)")
 @click.option("-p", "--proxy", help="the proxy to send requests, example: socks5://127.0.0.1:9150")
 @click.option("-v", "--verify", default=True, help="verify SSL when making the request")
 def suggestions(keywords, region, output, proxy, verify):
     """CLI function to perform a suggestions search using DuckDuckGo API."""
-    data = DDGS(proxy=_expand_proxy_tb_alias(proxy), verify=verify).suggestions(keywords=keywords, region=region)
+    data = _get_ddgs(click.get_current_context(), proxy, verify).suggestions(keywords=keywords, region=region)
+    yield
     keywords = _sanitize_keywords(keywords)
     if output:
         _save_data(keywords, data, function_name="suggestions", filename=output)
     else:
-        _print_data(data)
+        _print_data(data, paginate=click.get_current_context().obj["paginate"])
 
 
 if __name__ == "__main__":
@@ -6,11 +6,11 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from functools import cached_property
-from itertools import cycle, islice
+from itertools import chain, cycle, islice
 from random import choice
 from threading import Event
 from types import TracebackType
-from typing import cast
+from typing import Iterator, cast
 
 import primp  # type: ignore
 
@@ -247,6 +247,24 @@ class DDGS:
             results = self._text_lite(keywords, region, timelimit, max_results)
         return results
 
+    def _text_iter(
+        self,
+        keywords: str,
+        region: str = "wt-wt",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        backend: str = "api",
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Variant of text() that returns an iterator instead of building a list.
+
+        The requests are made before it returns, the results are yielded as their pages arrive.
+        Only the api backend is streamed page by page, html and lite fall back to text().
+        """
+        if backend == "api":
+            return self._text_api_iter(keywords, region, safesearch, timelimit, max_results)
+        return iter(self.text(keywords, region, safesearch, timelimit, backend, max_results))
+
     def _text_api(
         self,
         keywords: str,
@@ -272,6 +290,20 @@ class DDGS:
             RatelimitException: Inherits from DuckDuckGoSearchException, raised for exceeding API request rate limits.
             TimeoutException: Inherits from DuckDuckGoSearchException, raised for API request timeouts.
         """
+        return list(self._text_api_iter(keywords, region, safesearch, timelimit, max_results))
+
+    def _text_api_iter(
+        self,
+        keywords: str,
+        region: str = "wt-wt",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Backend of _text_api(): start the requests now, return an iterator over the results.
+
+        The vqd is fetched and all pages are submitted before returning, results are yielded as the pages arrive.
+        """
         assert keywords, "keywords is mandatory"
 
         vqd = self._get_vqd(keywords)
@@ -298,7 +330,6 @@ class DDGS:
             payload["df"] = timelimit
 
         cache = set()
-        results: list[dict[str, str]] = []
 
         def _text_api_page(s: int) -> list[dict[str, str]]:
             payload["s"] = f"{s}"
@@ -323,13 +354,9 @@ class DDGS:
         if max_results:
             max_results = min(max_results, 190)
             slist.extend(range(10, max_results, 15))
-        try:
-            for r in self._executor.map(_text_api_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(islice(results, max_results))
+        # executor.map submits every page at once, only draining the results is lazy
+        pages = self._executor.map(_text_api_page, slist)
+        return islice(chain.from_iterable(pages), max_results)
 
     def _text_html(
         self,
@@ -22,7 +22,7 @@ REGEX_STRIP_TAGS = re.compile("<.*?>")
 def json_dumps(obj: Any) -> str:
     try:
         return (
-            orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
             if HAS_ORJSON
             else json.dumps(obj, ensure_ascii=False, indent=2)
         )
@@ -30,6 +30,18 @@ def json_dumps(obj: Any) -> str:
         raise DuckDuckGoSearchException(f"{type(ex).__name__}: {ex}") from ex
 
 
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to utf-8 encoded json bytes, skipping the str round-trip when orjson is available."""
+    try:
+        return (
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if HAS_ORJSON
+            else json.dumps(obj, ensure_ascii=False, indent=2).encode()
+        )
+    except Exception as ex:
+        raise DuckDuckGoSearchException(f"{type(ex).__name__}: {ex}") from ex
+
+
 def json_loads(obj: str | bytes) -> Any:
     try:
         return orjson.loads(obj) if HAS_ORJSON else json.loads(obj)
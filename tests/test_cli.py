@@ -1,12 +1,21 @@
 import os
 import shutil
+import sys
 import time
 
 import pytest
 from click.testing import CliRunner
 
 from duckduckgo_search import DDGS, __version__
-from duckduckgo_search.cli import _download_results, _save_csv, _save_json, cli
+from duckduckgo_search.cli import (
+    _download_results,
+    _sanitize_keywords,
+    _save_csv,
+    _save_data,
+    _save_json,
+    _save_msgpack,
+    cli,
+)
 
 runner = CliRunner()
 
@@ -66,6 +75,69 @@ def test_translate_command():
     assert "language" in result.output
 
 
+def test_sanitize_keywords():
+    assert _sanitize_keywords('"cats dogs" filetype:pdf site:a.com/b\\c si:te') == "'cats_dogs'_pdf_a.com_b_c_"
+
+
+@pytest.fixture
+def stub_search(monkeypatch):
+    import duckduckgo_search.duckduckgo_search as ddgs_module
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, url, content):
+            self.url, self.content = url, content
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def request(self, method, url, params=None, **kwargs):
+            if params["q"] == "boom":
+                raise RuntimeError("boom")
+            if params["q"] == "slow":
+                time.sleep(0.5)  # finishes after the other searches of the chain
+            if "links.duckduckgo.com" in url:
+                page = b'[{"u": "https://example.com", "a": "body", "t": "title"}]'
+                return FakeResponse(url, b"DDG.pageLayout.load('d'," + page + b");DDG.duckbar.load(")
+            return FakeResponse(url, b'vqd="1-2"')
+
+    def news(self, keywords, **kwargs):
+        self._get_url("GET", "https://duckduckgo.com", params={"q": keywords})
+        return [{"title": keywords}]
+
+    monkeypatch.setattr(ddgs_module.primp, "Client", FakeClient)
+    monkeypatch.setattr(DDGS, "news", news)
+
+
+def test_chain_order(stub_search):
+    result = runner.invoke(cli, ["news", "-k", "slow", "news", "-k", "fast", "version"])
+    assert result.exit_code == 0
+    assert result.output.index("slow") < result.output.index("fast") < result.output.index(__version__)
+
+
+def test_chain_concurrent_text_output(stub_search, tmp_path):
+    # each text search is a vqd request and a page request of 0.5s, run one after another they take over 2s
+    start = time.perf_counter()
+    args = ["news", "-k", "slow"]
+    for name in ("a.json", "b.json"):
+        args += ["text", "-k", "slow", "-o", f"{tmp_path}/{name}"]
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert time.perf_counter() - start < 1.5
+    for name in ("a.json", "b.json"):
+        assert "https://example.com" in (tmp_path / name).read_text()
+
+
+def test_chain_failure(stub_search):
+    result = runner.invoke(cli, ["news", "-k", "slow", "news", "-k", "boom", "news", "-k", "never"])
+    assert result.exit_code != 0
+    assert "boom" in str(result.exception)
+    assert "title       slow" in result.output
+    assert "never" not in result.output
+
+
 def test_save_csv(tmp_path):
     keywords = "butterfly"
     with DDGS() as ddgs:
@@ -77,6 +149,55 @@ def test_save_csv(tmp_path):
     assert temp_file.exists()
 
 
+def test_save_csv_quoting(tmp_path):
+    import csv
+
+    results = [
+        {"title": "plain", "href": "https://example.com/a?b=c", "body": None},
+        {"title": 'with "quotes"', "href": "https://example.com", "body": "a, b\nc"},
+        {"title": "nested", "href": "", "body": {"k": "v"}},
+    ]
+    temp_file = tmp_path / "quoting.csv"
+    _save_csv(temp_file, results)
+
+    expected_file = tmp_path / "expected.csv"
+    with open(expected_file, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=results[0].keys(), quoting=csv.QUOTE_MINIMAL)
+        writer.writeheader()
+        writer.writerows(results)
+    assert temp_file.read_bytes() == expected_file.read_bytes()
+
+
+@pytest.mark.parametrize("save", [_save_csv, _save_json])
+@pytest.mark.parametrize(
+    "results",
+    [
+        [],
+        [{"title": "plain", "href": "https://example.com", "body": "a, b\nc"}],
+        [{"title": "one", "href": "https://1.com", "body": None}, {"title": "two", "href": "https://2.com", "body": 2}],
+    ],
+)
+def test_save_iterator(tmp_path, save, results):
+    list_file, iter_file = tmp_path / "list.out", tmp_path / "iter.out"
+    save(list_file, results)
+    save(iter_file, iter(results))
+    assert iter_file.read_bytes() == list_file.read_bytes()
+    if save is _save_json and not results:
+        assert iter_file.read_bytes() == b"[]"
+
+
+@pytest.mark.parametrize("save", [_save_csv, _save_json])
+def test_save_iterator_error(tmp_path, save):
+    def results():
+        yield {"title": "one", "href": "https://1.com"}
+        raise RuntimeError("ratelimit")
+
+    temp_file = tmp_path / "results.out"
+    with pytest.raises(RuntimeError):
+        save(temp_file, results())
+    assert not os.listdir(tmp_path)
+
+
 def test_save_json(tmp_path):
     keywords = "chicago"
     with DDGS() as ddgs:
@@ -88,6 +209,66 @@ def test_save_json(tmp_path):
     assert temp_file.exists()
 
 
+def test_save_msgpack(tmp_path):
+    msgpack = pytest.importorskip("msgpack")
+    results = [{"title": "one", "href": "https://1.com", "body": None}, {"title": "two", "href": "", "body": "b"}]
+
+    temp_file = tmp_path / "results.msgpack"
+    _save_msgpack(temp_file, results)
+    assert msgpack.unpackb(temp_file.read_bytes()) == results
+
+    _save_data("keywords", iter(results), "text", filename=str(tmp_path / "x.msgpack"))
+    assert msgpack.unpackb((tmp_path / "x.msgpack").read_bytes()) == results
+
+
+def test_download_results_dedup(tmp_path, monkeypatch):
+    import primp
+
+    requested = []
+
+    class FakeResponse:
+        status_code = 200
+        content = b"data"
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        def get(self, url):
+            requested.append(url)
+            return FakeResponse()
+
+    monkeypatch.setattr(primp, "Client", FakeClient)
+    results = [{"href": "https://example.com/a.pdf"}, {"href": "https://example.com/b.pdf"}]
+    download_dir = tmp_path / "downloads"
+
+    _download_results("keywords", results + results[:1], function_name="text", pathname=str(download_dir))
+    assert sorted(requested) == ["https://example.com/a.pdf", "https://example.com/b.pdf"]
+    assert sorted(os.listdir(download_dir)) == [".ddgs_downloaded", "1_a.pdf", "2_b.pdf"]
+    assert len((download_dir / ".ddgs_downloaded").read_text().split()) == 2
+
+    requested.clear()
+    _download_results("keywords", results, function_name="text", pathname=str(download_dir))
+    assert requested == []
+
+    # nothing submitted, or no directory given by the user: no sidecar file
+    _download_results("keywords", [], function_name="text", pathname=str(tmp_path / "empty"))
+    assert os.listdir(tmp_path / "empty") == []
+    monkeypatch.chdir(tmp_path)
+    _download_results("keywords", results, function_name="text")
+    (default_dir,) = [d for d in os.listdir(tmp_path) if d.startswith("text_keywords_")]
+    assert sorted(os.listdir(tmp_path / default_dir)) == ["1_a.pdf", "2_b.pdf"]
+
+
+def test_msgpack_checked_before_search(monkeypatch):
+    searched = []
+    monkeypatch.setitem(sys.modules, "msgpack", None)  # makes "import msgpack" raise ImportError
+    monkeypatch.setattr(DDGS, "news", lambda self, **kwargs: searched.append(kwargs) or [])
+    result = runner.invoke(cli, ["news", "-k", "usa", "-o", "msgpack"])
+    assert isinstance(result.exception, ImportError)
+    assert searched == []
+
+
 def test_text_download():
     keywords = "maradona"
     with DDGS() as ddgs: